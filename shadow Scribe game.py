@@ -4,7 +4,7 @@ import random
 import time
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Set
 
 # Initialize Pygame
 pygame.init()
@@ -13,6 +13,15 @@ pygame.init()
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+# Game logic runs at a fixed rate; rendering interpolates between ticks
+LOGIC_HZ = 30
+FIXED_DT = 1.0 / LOGIC_HZ
+MAX_FRAME_TIME = 0.25
+# Enemies outside the screen (plus a margin wider than their sprite) around the
+# player tick at half rate unless they are chasing
+ENEMY_ACTIVE_MARGIN = 64
+ENEMY_ACTIVE_HALF_WIDTH = SCREEN_WIDTH // 2 + ENEMY_ACTIVE_MARGIN
+ENEMY_ACTIVE_HALF_HEIGHT = SCREEN_HEIGHT // 2 + ENEMY_ACTIVE_MARGIN
 
 # Colors
 BLACK = (0, 0, 0)
@@ -29,6 +38,14 @@ ORANGE = (255, 165, 0)
 SHADOW_COLOR = (20, 20, 40)
 LIGHT_COLOR = (255, 255, 200, 100)
 
+# Movement keys and the direction each one pushes the player
+MOVE_KEYS = {
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1),
+}
+
 # Game States
 class GameState(Enum):
     MENU = 1
@@ -49,6 +66,31 @@ class TileType(Enum):
     CANDLE = 8
     SCROLL = 9
 
+# Plain int tile values for hot-path comparisons (skips the Enum lookups)
+TILE_FLOOR = TileType.FLOOR.value
+TILE_WALL = TileType.WALL.value
+TILE_SHADOW = TileType.SHADOW.value
+TILE_DOOR = TileType.DOOR.value
+TILE_SWITCH = TileType.SWITCH.value
+TILE_GAP = TileType.GAP.value
+TILE_BRIDGE = TileType.BRIDGE.value
+TILE_CANDLE = TileType.CANDLE.value
+TILE_SCROLL = TileType.SCROLL.value
+
+# Tile colour lookup, indexed by tile value
+TILE_COLORS = (
+    None,          # unused (tile values start at 1)
+    GRAY,          # FLOOR
+    DARK_GRAY,     # WALL
+    SHADOW_COLOR,  # SHADOW
+    GRAY,          # DOOR
+    GRAY,          # SWITCH
+    BLACK,         # GAP
+    ORANGE,        # BRIDGE
+    GRAY,          # CANDLE
+    GRAY,          # SCROLL
+)
+
 @dataclass
 class Spell:
     name: str
@@ -63,8 +105,10 @@ class Player:
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.size = 20
-        self.speed = 2
+        self.speed = 120  # pixels per second
         self.light_radius = 80
         self.max_light = 100
         self.current_light = self.max_light
@@ -76,38 +120,44 @@ class Player:
         self.mind_drain = 0
         self.max_mind_drain = 100
         
-    def move(self, dx: int, dy: int, level_map: List[List[int]]):
-        new_x = self.x + dx * self.speed
-        new_y = self.y + dy * self.speed
+        # Pre-drawn light cones for 0-100% light in 10% steps
+        self.light_surfaces = []
+        for step in range(11):
+            surface = pygame.Surface((self.light_radius * 2, self.light_radius * 2),
+                                     pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(surface, LIGHT_COLOR,
+                             (self.light_radius, self.light_radius),
+                             self.light_radius * step // 10)
+            self.light_surfaces.append(surface)
+        
+    def move(self, dx: int, dy: int, level: "Level", dt: float):
+        x = self.prev_x = self.x
+        y = self.prev_y = self.y
+        step = self.speed * dt
+        new_x = x + dx * step
+        new_y = y + dy * step
         
         # Check collision with walls
-        if self.can_move_to(new_x, new_y, level_map):
+        can_move, tile_type = self.can_move_to(new_x, new_y, level)
+        if can_move:
             self.x = new_x
             self.y = new_y
             
             # Check if on noisy tile
-            tile_x = int(self.x // 32)
-            tile_y = int(self.y // 32)
-            if 0 <= tile_x < len(level_map[0]) and 0 <= tile_y < len(level_map):
-                if level_map[tile_y][tile_x] == TileType.FLOOR.value:
-                    self.noise_level = 1
-                else:
-                    self.noise_level = 0
+            if tile_type == TILE_FLOOR:
+                self.noise_level = 1
+            else:
+                self.noise_level = 0
     
-    def can_move_to(self, x: int, y: int, level_map: List[List[int]]) -> bool:
-        # Check boundaries
-        if x < 0 or y < 0 or x >= len(level_map[0]) * 32 or y >= len(level_map) * 32:
-            return False
+    def can_move_to(self, x: float, y: float, level: "Level") -> Tuple[bool, Optional[int]]:
+        # Check boundaries (also keeps the tile indices below in range)
+        if x < 0 or y < 0 or x >= level.pixel_width or y >= level.pixel_height:
+            return False, None
             
         # Check tile collision
-        tile_x = int(x // 32)
-        tile_y = int(y // 32)
-        
-        if 0 <= tile_x < len(level_map[0]) and 0 <= tile_y < len(level_map):
-            tile_type = level_map[tile_y][tile_x]
-            return tile_type not in [TileType.WALL.value, TileType.GAP.value]
-        
-        return False
+        shift = level.tile_shift
+        tile_type = level.map[(int(y) >> shift) * level.width + (int(x) >> shift)]
+        return tile_type != TILE_WALL and tile_type != TILE_GAP, tile_type
     
     def update(self, dt: float):
         # Update invisibility
@@ -120,10 +170,12 @@ class Player:
         self.current_light = max(0, self.current_light - dt * 2)
         
         # Update mind drain (slowly recovers)
-        self.mind_drain = max(0, self.mind_drain - dt * 5)
+        if self.mind_drain > 0:
+            self.mind_drain = max(0, self.mind_drain - dt * 5)
         
         # Reset noise level
-        self.noise_level = max(0, self.noise_level - dt * 3)
+        if self.noise_level > 0:
+            self.noise_level = max(0, self.noise_level - dt * 3)
     
     def cast_spell(self, spell_name: str):
         if spell_name == "invisible":
@@ -136,36 +188,40 @@ class Enemy:
     def __init__(self, x: int, y: int, patrol_points: List[Tuple[int, int]]):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.size = 18
-        self.speed = 1
+        self.speed = 60  # pixels per second
         self.patrol_points = patrol_points
         self.current_target = 0
+        # Unit vector and distance left towards the current patrol point,
+        # worked out once per segment
+        self._patrol_dir: Optional[Tuple[float, float]] = None
+        self._patrol_remaining = 0.0
         self.detection_radius = 60
         self.sound_detection_radius = 40
+        # Squared radii so detection can skip the sqrt
+        self.detection_radius_sq = self.detection_radius * self.detection_radius
+        self.sound_detection_radius_sq = self.sound_detection_radius * self.sound_detection_radius
         self.is_chasing = False
         self.chase_timer = 0
-        self.frozen = False
-        self.freeze_timer = 0
         
-    def update(self, dt: float, player: Player):
-        # Update freeze status
-        if self.frozen:
-            self.freeze_timer -= dt
-            if self.freeze_timer <= 0:
-                self.frozen = False
-            return
+    def update(self, dt: float, player_x: float, player_y: float,
+               player_visible: bool, player_audible: bool):
+        # Work on locals and write the position back once at the end
+        x = self.prev_x = self.x
+        y = self.prev_y = self.y
         
         # Check for player detection
-        distance_to_player = math.sqrt((self.x - player.x)**2 + (self.y - player.y)**2)
+        dx = player_x - x
+        dy = player_y - y
+        distance_sq = dx * dx + dy * dy
         
         # Visual detection (only if player not invisible and in light)
-        can_see_player = (not player.is_invisible and 
-                         distance_to_player < self.detection_radius and
-                         player.current_light > 20)
+        can_see_player = player_visible and distance_sq < self.detection_radius_sq
         
         # Sound detection
-        can_hear_player = (distance_to_player < self.sound_detection_radius and 
-                          player.noise_level > 0.5)
+        can_hear_player = player_audible and distance_sq < self.sound_detection_radius_sq
         
         if can_see_player or can_hear_player:
             self.is_chasing = True
@@ -175,70 +231,86 @@ class Enemy:
             self.chase_timer -= dt
             if self.chase_timer <= 0:
                 self.is_chasing = False
-            else:
+            elif distance_sq > 0:
                 # Chase player
-                dx = player.x - self.x
-                dy = player.y - self.y
-                distance = math.sqrt(dx**2 + dy**2)
-                if distance > 0:
-                    self.x += (dx / distance) * self.speed
-                    self.y += (dy / distance) * self.speed
-        else:
+                step = self.speed * dt / math.sqrt(distance_sq)
+                self.x = x + dx * step
+                self.y = y + dy * step
+            # Chasing moves us off the patrol segment
+            self._patrol_dir = None
+        elif self.patrol_points:
             # Patrol behavior
-            if self.patrol_points:
+            if self._patrol_dir is None:
                 target_x, target_y = self.patrol_points[self.current_target]
-                dx = target_x - self.x
-                dy = target_y - self.y
-                distance = math.sqrt(dx**2 + dy**2)
+                dx = target_x - x
+                dy = target_y - y
+                distance_sq = dx * dx + dy * dy
                 
-                if distance < 5:
+                if distance_sq < 25:
                     self.current_target = (self.current_target + 1) % len(self.patrol_points)
                 else:
-                    self.x += (dx / distance) * self.speed * 0.5
-                    self.y += (dy / distance) * self.speed * 0.5
-    
-    def freeze(self, duration: float):
-        self.frozen = True
-        self.freeze_timer = duration
+                    distance = math.sqrt(distance_sq)
+                    self._patrol_dir = (dx / distance, dy / distance)
+                    self._patrol_remaining = distance
+            
+            if self._patrol_dir is not None:
+                step = self.speed * 0.5 * dt
+                self.x = x + self._patrol_dir[0] * step
+                self.y = y + self._patrol_dir[1] * step
+                self._patrol_remaining -= step
+                if self._patrol_remaining < 5:
+                    self.current_target = (self.current_target + 1) % len(self.patrol_points)
+                    self._patrol_dir = None
 
 class Level:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
         self.tile_size = 32
-        self.map = [[TileType.FLOOR.value for _ in range(width)] for _ in range(height)]
+        self.tile_shift = 5  # tile_size == 1 << tile_shift
+        self.pixel_width = width * self.tile_size
+        self.pixel_height = height * self.tile_size
+        # One byte per tile in a single row-major buffer: map[y * width + x]
+        self.map = bytearray([TILE_FLOOR]) * (width * height)
         self.enemies = []
         self.bridges = []
         self.switches = []
         self.candles = []
         self.scrolls = []
+        self.pickup_grid: Dict[Tuple[int, int], List[int]] = {}
+        self.gap_tiles: Set[Tuple[int, int]] = set()
+        self.enemy_grid: Dict[Tuple[int, int], List[Enemy]] = {}
+        self.enemy_tick = 0
+        # Freeze affects every enemy at once, so it is a single level-wide timer
+        self.freeze_timer = 0.0
+        self.background = None
         
     def generate_basic_level(self):
         # Create walls around the perimeter
-        for x in range(self.width):
-            self.map[0][x] = TileType.WALL.value
-            self.map[self.height-1][x] = TileType.WALL.value
-        for y in range(self.height):
-            self.map[y][0] = TileType.WALL.value
-            self.map[y][self.width-1] = TileType.WALL.value
+        width, height = self.width, self.height
+        self.map[:width] = bytes([TILE_WALL]) * width
+        self.map[(height-1) * width:] = bytes([TILE_WALL]) * width
+        self.map[::width] = bytes([TILE_WALL]) * height
+        self.map[width-1::width] = bytes([TILE_WALL]) * height
         
         # Add some internal walls
         for i in range(5):
             x = random.randint(2, self.width-3)
             y = random.randint(2, self.height-3)
-            self.map[y][x] = TileType.WALL.value
+            self.map[y * self.width + x] = TILE_WALL
         
         # Add shadow areas
         for i in range(3):
             x = random.randint(1, self.width-2)
             y = random.randint(1, self.height-2)
-            self.map[y][x] = TileType.SHADOW.value
+            self.map[y * self.width + x] = TILE_SHADOW
         
         # Add gaps
         for i in range(2):
             x = random.randint(1, self.width-2)
             y = random.randint(1, self.height-2)
-            self.map[y][x] = TileType.GAP.value
+            self.map[y * self.width + x] = TILE_GAP
+            self.gap_tiles.add((x, y))
         
         # Add enemies
         for i in range(2):
@@ -256,16 +328,100 @@ class Level:
         for i in range(3):
             x = random.randint(1, self.width-2)
             y = random.randint(1, self.height-2)
-            if self.map[y][x] == TileType.FLOOR.value:
+            if self.tile(x, y) == TILE_FLOOR:
                 self.candles.append((x, y))
+                self.pickup_grid.setdefault((x, y), []).append(TILE_CANDLE)
         
         # Add scroll
         x = random.randint(1, self.width-2)
         y = random.randint(1, self.height-2)
-        if self.map[y][x] == TileType.FLOOR.value:
+        if self.tile(x, y) == TILE_FLOOR:
             self.scrolls.append((x, y))
+            self.pickup_grid.setdefault((x, y), []).append(TILE_SCROLL)
+        
+        self.render_background()
+    
+    def tile(self, x: int, y: int) -> int:
+        return self.map[y * self.width + x]
+    
+    def render_background(self):
+        # Paint the static tilemap once; draw_game blits it every frame
+        self.background = pygame.Surface((self.pixel_width, self.pixel_height))
+        self.paint_tiles(0, 0, self.width, self.height)
+    
+    def paint_tiles(self, x0: int, y0: int, x1: int, y1: int):
+        for y in range(y0, y1):
+            row = y * self.width
+            for x in range(x0, x1):
+                pygame.draw.rect(self.background, TILE_COLORS[self.map[row + x]],
+                               (x * self.tile_size, y * self.tile_size,
+                                self.tile_size, self.tile_size))
+    
+    def freeze_enemies(self, duration: float):
+        self.freeze_timer = duration
+        # Pin interpolation so frozen enemies are drawn standing still
+        for enemy in self.enemies:
+            enemy.prev_x = enemy.x
+            enemy.prev_y = enemy.y
+    
+    def update_enemies(self, dt: float, player: Player):
+        # Frozen enemies don't move, so skip them (and the grid rebuild) entirely
+        if self.freeze_timer > 0:
+            self.freeze_timer -= dt
+            return
+        
+        # The player's side of detection is the same for every enemy, so work
+        # it out once per frame. Enemies are bucketed by tile in the same
+        # pass so proximity checks only visit neighbours.
+        player_visible = not player.is_invisible and player.current_light > 20
+        player_audible = player.noise_level > 0.5
+        player_x = player.x
+        player_y = player.y
+        
+        self.enemy_tick += 1
+        self.enemy_grid = {}
+        shift = self.tile_shift
+        for index, enemy in enumerate(self.enemies):
+            dx = enemy.x - player_x
+            dy = enemy.y - player_y
+            if (enemy.is_chasing or
+                (abs(dx) <= ENEMY_ACTIVE_HALF_WIDTH and abs(dy) <= ENEMY_ACTIVE_HALF_HEIGHT)):
+                enemy.update(dt, player_x, player_y, player_visible, player_audible)
+            elif (self.enemy_tick + index) & 1:
+                # Off-screen enemies can't detect the player; run them every
+                # other tick (staggered) with a doubled step
+                enemy.update(dt * 2, player_x, player_y, False, False)
+            else:
+                enemy.prev_x = enemy.x
+                enemy.prev_y = enemy.y
+            key = (int(enemy.x) >> shift, int(enemy.y) >> shift)
+            self.enemy_grid.setdefault(key, []).append(enemy)
+    
+    def enemies_near(self, x: float, y: float) -> List[Enemy]:
+        # Enemies in the 3x3 block of tiles around (x, y); covers any radius
+        # up to one tile
+        shift = self.tile_shift
+        tile_x = int(x) >> shift
+        tile_y = int(y) >> shift
+        nearby = []
+        for ty in range(tile_y - 1, tile_y + 2):
+            for tx in range(tile_x - 1, tile_x + 2):
+                bucket = self.enemy_grid.get((tx, ty))
+                if bucket:
+                    nearby.extend(bucket)
+        return nearby
+    
+    def place_bridge(self, tx: int, ty: int):
+        self.bridges.append((tx, ty))
+        self.gap_tiles.discard((tx, ty))
+        self.map[ty * self.width + tx] = TILE_BRIDGE
+        self.paint_tiles(tx, ty, tx + 1, ty + 1)
 
 class SpellSystem:
+    # Tile offsets within bridge range, nearest first
+    _BRIDGE_OFFSETS = sorted([(dx, dy) for dy in range(-2, 3) for dx in range(-2, 3)],
+                             key=lambda offset: offset[0] * offset[0] + offset[1] * offset[1])
+    
     def __init__(self):
         self.spells = {
             "invisible": Spell("Invisibility", "invisible", 10.0, 5.0, 3, 3, "Become undetectable for 5 seconds"),
@@ -274,39 +430,38 @@ class SpellSystem:
             "glow": Spell("Glow", "glow", 5.0, 0.0, 10, 10, "Restore light energy"),
         }
         self.cooldowns = {spell: 0.0 for spell in self.spells}
+        # Spells whose cooldown is still running; update() only visits these
+        self._active_cooldowns = set()
         self.current_input = ""
         self.typing_errors = 0
+        self._handlers = {
+            "invisible": self._cast_invisible,
+            "freeze": self._cast_freeze,
+            "bridge": self._cast_bridge,
+            "glow": self._cast_glow,
+        }
         
     def update(self, dt: float):
-        for spell in self.cooldowns:
-            self.cooldowns[spell] = max(0, self.cooldowns[spell] - dt)
+        if not self._active_cooldowns:
+            return
+        for spell in list(self._active_cooldowns):
+            remaining = self.cooldowns[spell] - dt
+            if remaining <= 0:
+                self.cooldowns[spell] = 0.0
+                self._active_cooldowns.discard(spell)
+            else:
+                self.cooldowns[spell] = remaining
     
     def try_cast_spell(self, word: str, player: Player, level: Level) -> bool:
-        if word in self.spells:
-            spell = self.spells[word]
+        spell = self.spells.get(word)
+        if spell is not None:
             if self.cooldowns[word] <= 0 and spell.uses_left > 0:
                 # Cast the spell
-                if word == "invisible":
-                    player.cast_spell("invisible")
-                elif word == "freeze":
-                    for enemy in level.enemies:
-                        enemy.freeze(spell.duration)
-                elif word == "bridge":
-                    # Create bridge at nearest gap
-                    player_tile_x = int(player.x // 32)
-                    player_tile_y = int(player.y // 32)
-                    for dy in range(-2, 3):
-                        for dx in range(-2, 3):
-                            tx, ty = player_tile_x + dx, player_tile_y + dy
-                            if (0 <= tx < level.width and 0 <= ty < level.height and
-                                level.map[ty][tx] == TileType.GAP.value):
-                                level.bridges.append((tx, ty))
-                                break
-                elif word == "glow":
-                    player.cast_spell("glow")
+                self._handlers[word](spell, player, level)
                 
                 # Apply cooldown and use
                 self.cooldowns[word] = spell.cooldown
+                self._active_cooldowns.add(word)
                 spell.uses_left -= 1
                 return True
         else:
@@ -315,6 +470,28 @@ class SpellSystem:
             self.typing_errors += 1
         
         return False
+    
+    def _cast_invisible(self, spell: Spell, player: Player, level: Level):
+        player.cast_spell("invisible")
+    
+    def _cast_freeze(self, spell: Spell, player: Player, level: Level):
+        level.freeze_enemies(spell.duration)
+    
+    def _cast_bridge(self, spell: Spell, player: Player, level: Level):
+        # Create bridge at nearest gap
+        player_tile_x = int(player.x) >> level.tile_shift
+        player_tile_y = int(player.y) >> level.tile_shift
+        gap_tiles = level.gap_tiles
+        if not gap_tiles:
+            return
+        for dx, dy in self._BRIDGE_OFFSETS:
+            tile = (player_tile_x + dx, player_tile_y + dy)
+            if tile in gap_tiles:
+                level.place_bridge(*tile)
+                break
+    
+    def _cast_glow(self, spell: Spell, player: Player, level: Level):
+        player.cast_spell("glow")
 
 class Game:
     def __init__(self):
@@ -324,6 +501,13 @@ class Game:
         self.font = pygame.font.Font(None, 24)
         self.large_font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 18)
+        self._text_cache: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+        self._sprite_cache: Dict[Tuple[Tuple[int, ...], int], pygame.Surface] = {}
+        
+        # Pre-rasterised pickup sprites
+        self._candle_surf = self.circle_sprite(YELLOW, 8)
+        self._scroll_surf = pygame.Surface((12, 16))
+        self._scroll_surf.fill(PURPLE)
         
         self.state = GameState.MENU
         self.player = Player(64, 64)
@@ -332,18 +516,38 @@ class Game:
         self.spell_system = SpellSystem()
         self.camera_x = 0
         self.camera_y = 0
+        # Fraction of a logic tick elapsed since the last update, for drawing
+        self.interpolation = 0.0
         
         # UI state
         self.current_input = ""
         self.input_active = False
         self.spellbook_open = False
         
+        # Movement input, tracked from key events rather than polled
+        self._held_move_keys = set()
+        self.input_dx = 0
+        self.input_dy = 0
+        
+    def _update_input_direction(self):
+        dx = dy = 0
+        for key in self._held_move_keys:
+            key_dx, key_dy = MOVE_KEYS[key]
+            dx += key_dx
+            dy += key_dy
+        self.input_dx = max(-1, min(1, dx))
+        self.input_dy = max(-1, min(1, dy))
+    
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
             
             elif event.type == pygame.KEYDOWN:
+                if event.key in MOVE_KEYS:
+                    self._held_move_keys.add(event.key)
+                    self._update_input_direction()
+                
                 if self.state == GameState.MENU:
                     if event.key == pygame.K_SPACE:
                         self.state = GameState.PLAYING
@@ -377,37 +581,31 @@ class Game:
                 elif self.state == GameState.GAME_OVER:
                     if event.key == pygame.K_r:
                         self.restart_game()
+            
+            elif event.type == pygame.KEYUP:
+                if event.key in self._held_move_keys:
+                    self._held_move_keys.discard(event.key)
+                    self._update_input_direction()
+            
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Key releases are not delivered while unfocused
+                self._held_move_keys.clear()
+                self._update_input_direction()
         
         return True
     
     def update(self, dt: float):
         if self.state == GameState.PLAYING:
             # Handle player movement
-            keys = pygame.key.get_pressed()
-            dx = dy = 0
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                dx = -1
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                dx = 1
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
-                dy = -1
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                dy = 1
-            
-            self.player.move(dx, dy, self.level.map)
+            self.player.move(self.input_dx, self.input_dy, self.level, dt)
             self.player.update(dt)
             
             # Update enemies
-            for enemy in self.level.enemies:
-                enemy.update(dt, self.player)
+            self.level.update_enemies(dt, self.player)
             
             # Update spell system
             self.spell_system.update(dt)
             
-            # Update camera
-            self.camera_x = self.player.x - SCREEN_WIDTH // 2
-            self.camera_y = self.player.y - SCREEN_HEIGHT // 2
-            
             # Check game over conditions
             if self.player.current_light <= 0:
                 self.state = GameState.GAME_OVER
@@ -416,29 +614,47 @@ class Game:
                 self.state = GameState.GAME_OVER
             
             # Check enemy collision
-            for enemy in self.level.enemies:
-                distance = math.sqrt((enemy.x - self.player.x)**2 + (enemy.y - self.player.y)**2)
-                if distance < 25:
+            for enemy in self.level.enemies_near(self.player.x, self.player.y):
+                dx = enemy.x - self.player.x
+                dy = enemy.y - self.player.y
+                if dx * dx + dy * dy < 625:
                     self.state = GameState.GAME_OVER
             
-            # Check candle collection
-            player_tile_x = int(self.player.x // 32)
-            player_tile_y = int(self.player.y // 32)
-            for i, (cx, cy) in enumerate(self.level.candles):
-                if cx == player_tile_x and cy == player_tile_y:
-                    self.player.current_light = min(self.player.max_light, 
-                                                  self.player.current_light + 40)
-                    self.level.candles.pop(i)
-                    break
-            
-            # Check scroll collection
-            for i, (sx, sy) in enumerate(self.level.scrolls):
-                if sx == player_tile_x and sy == player_tile_y:
-                    # Unlock new spell or restore uses
-                    for spell in self.spell_system.spells.values():
-                        spell.uses_left = spell.max_uses
-                    self.level.scrolls.pop(i)
-                    break
+            # Check candle and scroll collection
+            player_tile_x = int(self.player.x) >> self.level.tile_shift
+            player_tile_y = int(self.player.y) >> self.level.tile_shift
+            pickups = self.level.pickup_grid.pop((player_tile_x, player_tile_y), None)
+            if pickups:
+                for pickup in pickups:
+                    if pickup == TILE_CANDLE:
+                        self.player.current_light = min(self.player.max_light, 
+                                                      self.player.current_light + 40)
+                        self.level.candles.remove((player_tile_x, player_tile_y))
+                    elif pickup == TILE_SCROLL:
+                        # Unlock new spell or restore uses
+                        for spell in self.spell_system.spells.values():
+                            spell.uses_left = spell.max_uses
+                        self.level.scrolls.remove((player_tile_x, player_tile_y))
+    
+    def render_text(self, text: str, font: pygame.font.Font,
+                    color: Tuple[int, int, int]) -> pygame.Surface:
+        # Font rendering allocates a new surface, so reuse one per label
+        key = (text, id(font), color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+    
+    def circle_sprite(self, color: Tuple[int, ...], radius: int) -> pygame.Surface:
+        # Filled circle on a transparent square, blitted at (x - radius, y - radius)
+        key = (color, radius)
+        surface = self._sprite_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            self._sprite_cache[key] = surface
+        return surface
     
     def draw(self):
         self.screen.fill(BLACK)
@@ -455,9 +671,9 @@ class Game:
         pygame.display.flip()
     
     def draw_menu(self):
-        title = self.large_font.render("SHADOW SCRIBE", True, WHITE)
-        subtitle = self.font.render("A Magical Typing Adventure", True, GRAY)
-        instruction = self.font.render("Press SPACE to begin your quest", True, WHITE)
+        title = self.render_text("SHADOW SCRIBE", self.large_font, WHITE)
+        subtitle = self.render_text("A Magical Typing Adventure", self.font, GRAY)
+        instruction = self.render_text("Press SPACE to begin your quest", self.font, WHITE)
         
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 200))
         self.screen.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 250))
@@ -474,76 +690,66 @@ class Game:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = self.small_font.render(instruction, True, LIGHT_GRAY)
+            text = self.render_text(instruction, self.small_font, LIGHT_GRAY)
             self.screen.blit(text, (50, 500 + i * 25))
     
     def draw_game(self):
-        # Draw level
-        for y in range(self.level.height):
-            for x in range(self.level.width):
-                screen_x = x * 32 - self.camera_x
-                screen_y = y * 32 - self.camera_y
-                
-                if -32 <= screen_x <= SCREEN_WIDTH and -32 <= screen_y <= SCREEN_HEIGHT:
-                    tile_type = self.level.map[y][x]
-                    color = GRAY
-                    
-                    if tile_type == TileType.WALL.value:
-                        color = DARK_GRAY
-                    elif tile_type == TileType.SHADOW.value:
-                        color = SHADOW_COLOR
-                    elif tile_type == TileType.GAP.value:
-                        color = BLACK
-                    
-                    pygame.draw.rect(self.screen, color, 
-                                   (screen_x, screen_y, 32, 32))
+        alpha = self.interpolation
+        player_x = self.player.prev_x + (self.player.x - self.player.prev_x) * alpha
+        player_y = self.player.prev_y + (self.player.y - self.player.prev_y) * alpha
+        
+        # Update camera
+        self.camera_x = player_x - SCREEN_WIDTH // 2
+        self.camera_y = player_y - SCREEN_HEIGHT // 2
         
-        # Draw bridges
-        for bx, by in self.level.bridges:
-            screen_x = bx * 32 - self.camera_x
-            screen_y = by * 32 - self.camera_y
-            pygame.draw.rect(self.screen, ORANGE, (screen_x, screen_y, 32, 32))
+        # Draw level (only the part of the background inside the viewport)
+        view = pygame.Rect(int(self.camera_x), int(self.camera_y), SCREEN_WIDTH, SCREEN_HEIGHT)
+        view = view.clip(self.level.background.get_rect())
+        self.screen.blit(self.level.background,
+                         (view.x - self.camera_x, view.y - self.camera_y), view)
+        
+        # Sprites are queued in draw order and sent in a single blits() call
+        draws = []
         
         # Draw candles
         for cx, cy in self.level.candles:
-            screen_x = cx * 32 - self.camera_x + 16
-            screen_y = cy * 32 - self.camera_y + 16
-            pygame.draw.circle(self.screen, YELLOW, (screen_x, screen_y), 8)
+            draws.append((self._candle_surf,
+                          (cx * 32 - self.camera_x + 8, cy * 32 - self.camera_y + 8)))
         
         # Draw scrolls
         for sx, sy in self.level.scrolls:
-            screen_x = sx * 32 - self.camera_x + 16
-            screen_y = sy * 32 - self.camera_y + 16
-            pygame.draw.rect(self.screen, PURPLE, (screen_x-6, screen_y-8, 12, 16))
+            draws.append((self._scroll_surf,
+                          (sx * 32 - self.camera_x + 10, sy * 32 - self.camera_y + 8)))
         
         # Draw player light
         if self.player.current_light > 0:
-            light_surface = pygame.Surface((self.player.light_radius * 2, 
-                                          self.player.light_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(light_surface, LIGHT_COLOR, 
-                             (self.player.light_radius, self.player.light_radius), 
-                             int(self.player.light_radius * (self.player.current_light / 100)))
-            
-            self.screen.blit(light_surface, 
-                           (self.player.x - self.player.light_radius - self.camera_x,
-                            self.player.y - self.player.light_radius - self.camera_y))
+            light_step = int(self.player.current_light / self.player.max_light * 10 + 0.5)
+            draws.append((self.player.light_surfaces[light_step],
+                          (player_x - self.player.light_radius - self.camera_x,
+                           player_y - self.player.light_radius - self.camera_y)))
         
         # Draw enemies
+        enemies_frozen = self.level.freeze_timer > 0
         for enemy in self.level.enemies:
-            screen_x = enemy.x - self.camera_x
-            screen_y = enemy.y - self.camera_y
+            screen_x = enemy.prev_x + (enemy.x - enemy.prev_x) * alpha - self.camera_x
+            screen_y = enemy.prev_y + (enemy.y - enemy.prev_y) * alpha - self.camera_y
             color = RED if enemy.is_chasing else BLUE
-            if enemy.frozen:
+            if enemies_frozen:
                 color = LIGHT_GRAY
-            pygame.draw.circle(self.screen, color, (int(screen_x), int(screen_y)), enemy.size)
+            draws.append((self.circle_sprite(color, enemy.size),
+                          (int(screen_x) - enemy.size, int(screen_y) - enemy.size)))
         
         # Draw player
-        screen_x = self.player.x - self.camera_x
-        screen_y = self.player.y - self.camera_y
+        screen_x = player_x - self.camera_x
+        screen_y = player_y - self.camera_y
         player_color = GREEN
         if self.player.is_invisible:
             player_color = (50, 255, 50, 100)
-        pygame.draw.circle(self.screen, player_color, (int(screen_x), int(screen_y)), self.player.size)
+        # The screen has no alpha channel, so the player has always drawn opaque
+        draws.append((self.circle_sprite(player_color[:3], self.player.size),
+                      (int(screen_x) - self.player.size, int(screen_y) - self.player.size)))
+        
+        self.screen.blits(draws, False)
         
         # Draw UI
         self.draw_ui()
@@ -559,7 +765,7 @@ class Game:
         light_fill = int((self.player.current_light / self.player.max_light) * light_width)
         pygame.draw.rect(self.screen, YELLOW, (light_x, light_y, light_fill, light_height))
         
-        light_text = self.small_font.render("Light", True, WHITE)
+        light_text = self.render_text("Light", self.small_font, WHITE)
         self.screen.blit(light_text, (light_x, light_y - 20))
         
         # Mind drain meter
@@ -568,7 +774,7 @@ class Game:
         mind_fill = int((self.player.mind_drain / self.player.max_mind_drain) * light_width)
         pygame.draw.rect(self.screen, RED, (light_x, mind_y, mind_fill, light_height))
         
-        mind_text = self.small_font.render("Mind Drain", True, WHITE)
+        mind_text = self.render_text("Mind Drain", self.small_font, WHITE)
         self.screen.blit(mind_text, (light_x, mind_y - 20))
         
         # Current input
@@ -576,7 +782,7 @@ class Game:
         self.screen.blit(input_text, (20, SCREEN_HEIGHT - 60))
         
         # Instructions
-        instruction_text = self.small_font.render("TAB: Spellbook | Type spells and press ENTER", True, LIGHT_GRAY)
+        instruction_text = self.render_text("TAB: Spellbook | Type spells and press ENTER", self.small_font, LIGHT_GRAY)
         self.screen.blit(instruction_text, (20, SCREEN_HEIGHT - 30))
     
     def draw_spellbook(self):
@@ -596,7 +802,7 @@ class Game:
         pygame.draw.rect(self.screen, WHITE, (book_x, book_y, book_width, book_height), 3)
         
         # Title
-        title = self.font.render("SPELLBOOK", True, WHITE)
+        title = self.render_text("SPELLBOOK", self.font, WHITE)
         self.screen.blit(title, (book_x + 20, book_y + 20))
         
         # Spells
@@ -607,12 +813,12 @@ class Game:
             # Spell name and word
             spell_text = f"{spell.name} ({spell.word})"
             color = WHITE if cooldown <= 0 and spell.uses_left > 0 else GRAY
-            text = self.font.render(spell_text, True, color)
+            text = self.render_text(spell_text, self.font, color)
             self.screen.blit(text, (book_x + 20, book_y + y_offset))
             
             # Uses left
             uses_text = f"Uses: {spell.uses_left}/{spell.max_uses}"
-            uses_surface = self.small_font.render(uses_text, True, color)
+            uses_surface = self.render_text(uses_text, self.small_font, color)
             self.screen.blit(uses_surface, (book_x + 300, book_y + y_offset))
             
             # Cooldown
@@ -622,13 +828,13 @@ class Game:
                 self.screen.blit(cooldown_surface, (book_x + 400, book_y + y_offset))
             
             # Description
-            desc_surface = self.small_font.render(spell.description, True, LIGHT_GRAY)
+            desc_surface = self.render_text(spell.description, self.small_font, LIGHT_GRAY)
             self.screen.blit(desc_surface, (book_x + 20, book_y + y_offset + 20))
             
             y_offset += 60
         
         # Instructions
-        instruction = self.small_font.render("Press TAB to close", True, WHITE)
+        instruction = self.render_text("Press TAB to close", self.small_font, WHITE)
         self.screen.blit(instruction, (book_x + 20, book_y + book_height - 30))
     
     def draw_game_over(self):
@@ -637,11 +843,11 @@ class Game:
         overlay.fill(BLACK)
         self.screen.blit(overlay, (0, 0))
         
-        game_over_text = self.large_font.render("GAME OVER", True, RED)
+        game_over_text = self.render_text("GAME OVER", self.large_font, RED)
         self.screen.blit(game_over_text, 
                         (SCREEN_WIDTH//2 - game_over_text.get_width()//2, 300))
         
-        restart_text = self.font.render("Press R to restart", True, WHITE)
+        restart_text = self.render_text("Press R to restart", self.font, WHITE)
         self.screen.blit(restart_text, 
                         (SCREEN_WIDTH//2 - restart_text.get_width()//2, 400))
     
@@ -655,11 +861,16 @@ class Game:
     
     def run(self):
         running = True
+        accumulator = 0.0
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            # Clamp long stalls so the logic doesn't try to catch up all at once
+            accumulator += min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
             
             running = self.handle_events()
-            self.update(dt)
+            while accumulator >= FIXED_DT:
+                self.update(FIXED_DT)
+                accumulator -= FIXED_DT
+            self.interpolation = accumulator / FIXED_DT
             self.draw()
         
         pygame.quit()